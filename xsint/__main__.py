@@ -4,8 +4,10 @@ import contextlib
 import getpass
 import importlib
 import io
+import itertools
 import os
 import shutil
+import signal
 import subprocess
 import sys
 import time
@@ -15,7 +17,6 @@ from urllib.parse import urlparse
 from . import __version__
 from ._version_check import check_for_update
 from .config import get_config
-from .core import XsintEngine
 from .ui import print_results
 
 
@@ -166,61 +167,95 @@ _RED = "\033[31m"
 _YELLOW = "\033[33m"
 _RESET = "\033[0m"
 
+_DOT_FRAMES = (".  ", ".. ", "...", " ..", "  .", "   ")
+_DOT_FPS = 4
+# Synchronized output (DEC mode 2026); terminals without it ignore these.
+_BSU = "\033[?2026h"
+_ESU = "\033[?2026l"
 
-def _module_status_line(name, info, stream):
+# Row tags, keyed by whether the progress stream is a TTY.
+_STATUS_TAGS = {
+    True: {
+        "running": f"{_YELLOW}[*]{_RESET}",
+        "hit": f"{_GREEN}[+]{_RESET}",
+        "miss": f"{_RED}[-]{_RESET}",
+    },
+    False: {"running": "[*]", "hit": "[+]", "miss": "[-]"},
+}
+
+
+class _ModuleRow:
+    """Dashboard state for one module."""
+
+    __slots__ = ("status", "count", "offset", "prefix", "line")
+
+    def __init__(self, status, offset=0):
+        self.status = status  # "running" | "done"
+        self.count = 0
+        self.offset = offset  # dot-animation phase (running only)
+        self.prefix = None    # "[*] name: " (running only, built on first use)
+        self.line = None      # preformatted row (done only)
+
+
+def _module_status_line(name, info, stream, frame=None):
     """Format one dashboard line for `name`, colored if `stream` is a TTY.
 
     [*] yellow → still running
     [+] green  → finished, results > 0
     [-] red    → finished, no results
+
+    `frame` is the dot-animation tick; defaults to the current one.
     """
-    is_tty = stream.isatty()
+    if info.status == "running":
+        if info.prefix is None:
+            info.prefix = f"{_STATUS_TAGS[stream.isatty()]['running']} {name}: "
+        if frame is None:
+            frame = int(time.monotonic() * _DOT_FPS)
+        phase = (frame + info.offset) % len(_DOT_FRAMES)
+        return info.prefix + _DOT_FRAMES[phase]
+
+    tags = _STATUS_TAGS[stream.isatty()]
+    n = info.count
+    if n > 0:
+        suffix = "s" if n != 1 else ""
+        return f"{tags['hit']} {name}: {n} result{suffix}"
+    return f"{tags['miss']} {name}: no results"
+
 
-    def paint(text, color):
-        return f"{color}{text}{_RESET}" if is_tty else text
+def _terminal_rows(stream):
+    """Height of the terminal behind `stream`, falling back to stdout's."""
+    try:
+        return os.get_terminal_size(stream.fileno()).lines
+    except (AttributeError, ValueError, OSError):
+        return shutil.get_terminal_size().lines
 
-    if info["status"] == "running":
-        # Each module gets a phase offset hashed from its name so their
-        # dot animations don't tick in unison — gives the impression of
-        # independent per-module pacing without per-module timers.
-        DOT_FRAMES = [".  ", ".. ", "...", " ..", "  .", "   "]
-        offset = (abs(hash(name)) // 7) % len(DOT_FRAMES)
-        phase = (int(time.monotonic() * 4) + offset) % len(DOT_FRAMES)
-        return f"{paint('[*]', _YELLOW)} {name}: {DOT_FRAMES[phase]}"
 
-    n = info["count"]
-    if n > 0:
-        suffix = "s" if n != 1 else ""
-        return f"{paint('[+]', _GREEN)} {name}: {n} result{suffix}"
-    return f"{paint('[-]', _RED)} {name}: no results"
+_PAINTED_STATUS = {
+    "active": f"{_GREEN}active{_RESET}",
+    "locked": f"{_RED}locked{_RESET}",
+}
 
 
 def _colorize_status(value):
-    if not sys.stdout.isatty():
-        return value
-    if value == "active":
-        return f"{_GREEN}{value}{_RESET}"
-    if value == "locked":
-        return f"{_RED}{value}{_RESET}"
-    return value
+    return _PAINTED_STATUS.get(value, value)
 
 
 def _print_table(headers, rows):
     # Compute widths from raw values (no ANSI codes) so columns align.
     cols = list(zip(headers, *rows)) if rows else [(h,) for h in headers]
     widths = [max(len(str(c)) for c in col) for col in cols]
-    status_idx = headers.index("status") if "status" in headers else -1
-    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    colored = "status" in headers and sys.stdout.isatty()
+    status_idx = headers.index("status") if colored else -1
+    lines = ["  ".join(str(h).ljust(w) for h, w in zip(headers, widths))]
     for row in rows:
-        out = []
-        for i, (cell, w) in enumerate(zip(row, widths)):
-            text = str(cell)
-            pad = " " * (w - len(text))
-            if i == status_idx:
-                out.append(_colorize_status(text) + pad)
-            else:
-                out.append(text + pad)
-        print("  ".join(out))
+        out = [str(cell).ljust(w) for cell, w in zip(row, widths)]
+        if colored:
+            # Paint the bare value and keep the padding ljust already made.
+            text = str(row[status_idx])
+            out[status_idx] = _colorize_status(text) + out[status_idx][len(text):]
+        lines.append("  ".join(out))
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 
 def _build_modules_table(caps, type_filter="all"):
@@ -300,11 +335,15 @@ def _maybe_print_update_notice():
         return
     cur, latest = info
     if sys.stdout.isatty():
-        print(f"\033[33m[!] xsint {latest} is available (you have {cur}).\033[0m", file=sys.stderr)
-        print(f"\033[2m    Update with: xsint --update\033[0m", file=sys.stderr)
+        sys.stderr.write(
+            f"\033[33m[!] xsint {latest} is available (you have {cur}).\033[0m\n"
+            f"\033[2m    Update with: xsint --update\033[0m\n"
+        )
     else:
-        print(f"[!] xsint {latest} is available (you have {cur}).", file=sys.stderr)
-        print("    Update with: xsint --update", file=sys.stderr)
+        sys.stderr.write(
+            f"[!] xsint {latest} is available (you have {cur}).\n"
+            "    Update with: xsint --update\n"
+        )
 
 
 def _do_update():
@@ -332,10 +371,13 @@ def _do_update():
     YEL = "\033[33m" if is_tty else ""
     RST = "\033[0m" if is_tty else ""
 
-    print(file=sys.stderr)
-    print(f"  {BOLD}xsint update{RST}  {DIM}({_INSTALL_URL}){RST}", file=sys.stderr)
-    print(f"  {DIM}current version: {RST}{cur}", file=sys.stderr)
-    print(file=sys.stderr)
+    sys.stderr.write(
+        "\n"
+        f"  {BOLD}xsint update{RST}  {DIM}({_INSTALL_URL}){RST}\n"
+        f"  {DIM}current version: {RST}{cur}\n"
+        "\n"
+    )
+    sys.stderr.flush()
 
     cmd = f"curl -fsSL {_INSTALL_URL} | bash"
     env = os.environ.copy()
@@ -529,9 +571,10 @@ def _handle_auth(auth_args):
 
 
 async def async_main(args):
-    proxy = args.proxy or get_config().get("proxy")
+    config = get_config()
+    proxy = args.proxy or config.get("proxy")
     if proxy:
-        get_config().data["proxy"] = proxy
+        config.data["proxy"] = proxy
         # Make every httpx client created by any module pick up the proxy
         # automatically via trust_env=True (httpx default). aiohttp clients
         # in the engine already wire proxy explicitly via ProxyConnector.
@@ -549,6 +592,9 @@ async def async_main(args):
             _httpx.AsyncClient.__init__ = _patched_init
             _httpx.AsyncClient._xsint_verify_patched = True
 
+    # Deferred so --version/--help/--auth/--update don't import aiohttp.
+    from .core import XsintEngine
+
     engine = XsintEngine(proxy=proxy)
     try:
         if args.modules:
@@ -572,78 +618,153 @@ async def async_main(args):
         to_stderr = args.fmt in ("json", "html")
         progress_stream = sys.stderr if to_stderr else sys.stdout
         animate = progress_stream.isatty()
-        # name -> {status: "running"|"done", count: int, status_str: str}
+        # name -> _ModuleRow, in module_start order.
         modules_state = {}
+        running = set()
         spinner_stop = asyncio.Event()
-        last_lines = [0]  # mutable so closures can update
-
-        def _render():
-            """Redraw the dashboard on the chosen progress stream."""
+        redraw = asyncio.Event()
+        last_frame = []  # rows as last written; mutated in place
+        term_rows = [_terminal_rows(progress_stream)]  # refreshed on SIGWINCH
+        resize_watched = False
+
+        def _render(final=False):
+            """Redraw the changed rows of the dashboard.
+
+            `final` marks the pass after the scan: it always writes, and
+            rows that scrolled out of reach while still stale are
+            reprinted below the dashboard.
+            """
+            # Cursor-up stops at the top of the screen, so once the
+            # dashboard is taller than the terminal only the bottom rows
+            # are reachable; the rest are already in scrollback. Repaint
+            # just that visible window — climbing further would clamp and
+            # smear later rows over the wrong lines.
+            rows = term_rows[0] if resize_watched else _terminal_rows(progress_stream)
+            up = min(len(last_frame), max(1, rows - 1))
+            start = len(last_frame) - up
+
+            frame = int(time.monotonic() * _DOT_FPS)
             lines = [
-                _module_status_line(name, info, progress_stream)
-                for name, info in modules_state.items()
+                info.line or _module_status_line(name, info, progress_stream, frame)
+                for name, info in itertools.islice(modules_state.items(), start, None)
             ]
 
-            buf = []
-            if last_lines[0]:
-                buf.append(f"\033[{last_lines[0]}A")
-            for rendered in lines:
-                buf.append("\r\033[2K" + rendered + "\n")
+            if not final and lines == last_frame[start:]:
+                return
+
+            buf = [_BSU]
+            if up:
+                buf.append(f"\033[{up}A")
+            for i, rendered in enumerate(lines, start):
+                if i < len(last_frame) and last_frame[i] == rendered:
+                    buf.append("\n")
+                else:
+                    buf.append("\r\033[2K" + rendered + "\n")
+            if final:
+                for i, (name, info) in enumerate(
+                    itertools.islice(modules_state.items(), start)
+                ):
+                    line = info.line or _module_status_line(name, info, progress_stream, frame)
+                    if line != last_frame[i]:
+                        buf.append(line + "\n")
+            buf.append(_ESU)
             progress_stream.write("".join(buf))
             progress_stream.flush()
-            last_lines[0] = len(lines)
+            last_frame[start:] = lines
 
-        def on_progress(event):
+        def _on_module_start(event):
+            name = event.get("module", "?")
+            # Each module gets a phase offset hashed from its name so their
+            # dot animations don't tick in unison — gives the impression of
+            # independent per-module pacing without per-module timers.
+            offset = (abs(hash(name)) // 7) % len(_DOT_FRAMES)
+            modules_state[name] = _ModuleRow("running", offset=offset)
+            running.add(name)
+            if animate:
+                redraw.set()
+            else:
+                progress_stream.write(
+                    _module_status_line(name, modules_state[name],
+                                        progress_stream) + "\n"
+                )
+                progress_stream.flush()
+
+        def _on_module_done(event):
             nonlocal ran_any
-            kind = event.get("event")
+            ran_any = True
             name = event.get("module", "?")
-            if kind == "module_start":
-                modules_state[name] = {"status": "running", "count": 0}
-                if animate:
-                    _render()
-                else:
-                    progress_stream.write(
-                        _module_status_line(name, modules_state[name],
-                                            progress_stream) + "\n"
-                    )
-                    progress_stream.flush()
-            elif kind == "module_done":
-                ran_any = True
-                count = int(event.get("count", 0) or 0)
-                modules_state[name] = {"status": "done", "count": count}
-                if animate:
-                    _render()
-                else:
-                    progress_stream.write(
-                        _module_status_line(name, modules_state[name],
-                                            progress_stream) + "\n"
-                    )
-                    progress_stream.flush()
+            count = int(event.get("count", 0) or 0)
+            info = modules_state.get(name)
+            if info is None:
+                info = modules_state[name] = _ModuleRow("done")
+            info.status = "done"
+            info.count = count
+            info.line = _module_status_line(name, info, progress_stream)
+            running.discard(name)
+            if animate:
+                redraw.set()
+            else:
+                progress_stream.write(info.line + "\n")
+                progress_stream.flush()
+
+        progress_handlers = {
+            "module_start": _on_module_start,
+            "module_done": _on_module_done,
+        }
+
+        def on_progress(event):
+            handler = progress_handlers.get(event.get("event"))
+            if handler:
+                handler(event)
 
         async def _animator():
-            # Tick at ~12 fps. Faster than strictly needed for the 4 fps
-            # dot animation, but more frequent ticks mean any one-off
-            # event-loop hiccup (cold-cache import, lock contention)
-            # doesn't stretch into a visible stutter.
+            # Wake at the next dot-frame boundary or on a progress event;
+            # a burst of events since the last pass is drawn once.
+            drawn_frame = None
             while not spinner_stop.is_set():
-                if any(info["status"] == "running" for info in modules_state.values()):
+                now = time.monotonic()
+                frame = int(now * _DOT_FPS)
+                if redraw.is_set() or (frame != drawn_frame and running):
+                    redraw.clear()
                     _render()
+                    drawn_frame = frame
                 try:
-                    await asyncio.wait_for(spinner_stop.wait(), timeout=0.08)
+                    await asyncio.wait_for(
+                        redraw.wait(), timeout=(frame + 1) / _DOT_FPS - now
+                    )
                 except asyncio.TimeoutError:
                     pass
 
+        def _on_resize():
+            # Width-only resizes don't affect the dashboard.
+            rows = _terminal_rows(progress_stream)
+            if rows == term_rows[0]:
+                return
+            term_rows[0] = rows
+            redraw.set()
+
+        loop = asyncio.get_running_loop()
+        if animate and hasattr(signal, "SIGWINCH"):
+            try:
+                loop.add_signal_handler(signal.SIGWINCH, _on_resize)
+                resize_watched = True
+            except (NotImplementedError, RuntimeError):
+                pass
+
         spinner_task = asyncio.create_task(_animator()) if animate else None
         try:
             report = await engine.scan(args.target, progress_cb=on_progress)
         finally:
             spinner_stop.set()
+            redraw.set()
+            if resize_watched:
+                loop.remove_signal_handler(signal.SIGWINCH)
             if spinner_task:
                 await spinner_task
             # Final render so any module that wrapped up between the last
             # animator tick and the scan return is shown in its done state.
             if animate and modules_state:
-                _render()
+                _render(final=True)
 
         if report.get("error"):
             print(f"[!] {report['error'].splitlines()[0]}", file=sys.stderr)
@@ -7,11 +7,15 @@ that finish during the wrapped window. Instead, we patch `print` and
 only their output, leaves everyone else's prints untouched.
 """
 import importlib
+import os
 import sys
 
 
 _NOOP = lambda *args, **kwargs: None
 
+# Shared sink for muted consoles, opened on first use.
+_devnull = None
+
 
 def silence_module_prints(module_names):
     """Replace `print` in each module's namespace with a no-op.
@@ -30,7 +34,8 @@ def silence_module_prints(module_names):
 
 def quiet_rich_console(console):
     """Mute a rich.Console instance in-place by sending it to /dev/null."""
-    import os
-    null_file = open(os.devnull, "w")
-    console.file = null_file
+    global _devnull
+    if _devnull is None:
+        _devnull = open(os.devnull, "w")
+    console.file = _devnull
 
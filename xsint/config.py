@@ -15,7 +15,7 @@ class ConfigManager:
             try:
                 with open(CONFIG_FILE, "r") as f:
                     self.data = json.load(f)
-            except:
+            except (OSError, ValueError):
                 self.data = {}
 
     def save(self):
@@ -45,9 +45,12 @@ class ConfigManager:
         return None
 
 
-# Singleton instance
-_config = ConfigManager()
+# Created on first use so importing xsint doesn't read config.json.
+_config = None
 
 
 def get_config():
+    global _config
+    if _config is None:
+        _config = ConfigManager()
     return _config
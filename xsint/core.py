@@ -41,8 +41,11 @@ def _parse_info(filepath):
 class XsintEngine:
     def __init__(self, proxy=None):
         self.session = None
-        self.proxy = proxy or get_config().get("proxy")
+        self._config = get_config()
+        self.proxy = proxy or self._config.get("proxy")
         self._modules_path = os.path.join(os.path.dirname(__file__), "modules")
+        # _scan_modules result, filled on first use.
+        self._module_index = None
         env_timeout = os.getenv("XSINT_MODULE_TIMEOUT", "25").strip()
         try:
             self.module_timeout = max(5, int(env_timeout))
@@ -68,10 +71,10 @@ class XsintEngine:
                         if len(host_port) == 2:
                             try:
                                 port = int(host_port[1])
-                                if not (1 <= port <= 65535):
-                                    raise ValueError(f"Proxy port out of range: {port}")
                             except ValueError:
                                 raise ValueError(f"Invalid proxy port: {host_port[1]}")
+                            if not (1 <= port <= 65535):
+                                raise ValueError(f"Proxy port out of range: {port}")
 
                     # ProxyConnector handles both HTTP and SOCKS proxies
                     from aiohttp_socks import ProxyConnector
@@ -106,8 +109,11 @@ class XsintEngine:
 
     def _scan_modules(self) -> List[Dict[str, Any]]:
         """Scan all module .py files and extract INFO dicts via ast."""
+        if self._module_index is not None:
+            return self._module_index
         modules = []
         if not os.path.exists(self._modules_path):
+            self._module_index = modules
             return modules
 
         for filename in sorted(os.listdir(self._modules_path)):
@@ -124,8 +130,11 @@ class XsintEngine:
                 {
                     "name": filename[:-3],
                     "info": info,
+                    "free": frozenset(info.get("free", [])),
+                    "paid": frozenset(info.get("paid", [])),
                 }
             )
+        self._module_index = modules
         return modules
 
     def get_capabilities(self) -> Dict[str, List[Dict[str, Any]]]:
@@ -133,15 +142,15 @@ class XsintEngine:
         Build per-type module listing from INFO dicts.
         Returns: { 'email': [{'name': ..., 'status': 'active'|'locked', 'info': ...}, ...] }
         """
-        config = get_config()
+        config = self._config
         caps = defaultdict(list)
 
         for mod in self._scan_modules():
             info = mod["info"]
             api_key = info.get("api_key")
             has_key = config.get_api_key(api_key) is not None if api_key else True
-            free_types = set(info.get("free", []))
-            paid_types = set(info.get("paid", []))
+            free_types = mod["free"]
+            paid_types = mod["paid"]
             runtime_ready = True
             runtime_reason = ""
 
@@ -195,16 +204,16 @@ class XsintEngine:
         Import modules that are active for the given type.
         Returns a list of tuples: (module_name, run_function, info_dict)
         """
-        config = get_config()
+        config = self._config
         runners = []
         skipped = []
 
         for mod in self._scan_modules():
             info = mod["info"]
-            free_types = set(info.get("free", []))
-            paid_types = set(info.get("paid", []))
+            free_types = mod["free"]
+            paid_types = mod["paid"]
 
-            if target_type not in free_types | paid_types:
+            if target_type not in free_types and target_type not in paid_types:
                 continue
 
             # Skip locked modules (paid type without key)
@@ -216,18 +225,19 @@ class XsintEngine:
             try:
                 imported = importlib.import_module(f"xsint.modules.{mod['name']}")
                 ready, reason = self._module_ready(imported)
-                if not ready:
-                    skipped.append(
-                        {
-                            "name": mod["name"],
-                            "reason": reason or "not configured",
-                        }
-                    )
-                    continue
-                if hasattr(imported, "run") and callable(imported.run):
-                    runners.append((mod["name"], imported.run, info))
             except Exception:
-                pass
+                continue
+            if not ready:
+                skipped.append(
+                    {
+                        "name": mod["name"],
+                        "reason": reason or "not configured",
+                    }
+                )
+                continue
+            run = getattr(imported, "run", None)
+            if callable(run):
+                runners.append((mod["name"], run, info))
 
         return runners, skipped
 
@@ -148,14 +148,16 @@ async def get_gmaps_profile(client, gaia_id):
             if len(data) > 16 and isinstance(data[16], list) and len(data[16]) > 0:
                 if isinstance(data[16][0], str): result["name"] = data[16][0]
             
-            def find_stats(obj):
+            # Pre-order walk of the nested pb arrays (children pushed reversed).
+            stack = [data]
+            while stack:
+                obj = stack.pop()
                 if isinstance(obj, list):
                     if len(obj) > 8 and isinstance(obj[6], str) and isinstance(obj[7], int):
                         if obj[6] in ["Reviews", "Photos", "Answers", "Ratings", "Videos", "Edits"]:
                             result["stats"][obj[6]] = obj[7]
-                    for item in obj: find_stats(item)
-            find_stats(data)
-    except: pass
+                    stack.extend(reversed(obj))
+    except Exception: pass
     return result
 
 async def run(session, target):
@@ -275,7 +277,7 @@ async def _run_lookup(target, PARENT):
             try:
                 people = PeoplePaHttp(creds)
                 found, person = await people.people_lookup(client, target, params_template="max_details")
-            except:
+            except Exception:
                 pass
 
         if not found or not person:
@@ -262,7 +262,7 @@ async def _run_lookup(target, PARENT):
             # Clean up the resolve repo
             try:
                 await github.delete_repo(runner, resolve_repo)
-            except:
+            except Exception:
                 pass
 
             if not emails_accounts:
@@ -429,11 +429,11 @@ async def _run_lookup(target, PARENT):
         if temp_repo_name:
             try:
                 await github.delete_repo(runner, temp_repo_name)
-            except:
+            except Exception:
                 pass
         try:
             delete_tmp_dir()
-        except:
+        except Exception:
             pass
 
     return 0, results
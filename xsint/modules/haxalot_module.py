@@ -5,6 +5,7 @@ import sys
 import os
 import logging
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from bs4 import BeautifulSoup, NavigableString
 from telethon import TelegramClient
@@ -182,6 +183,7 @@ async def lookup(query: str) -> str:
         sent = await c.send_message(BOT, query)
         start = time.time()
         msgs = []
+        seen_ids = set()
 
         # Collect bot replies until we see something actionable: a media
         # attachment, a download-button message, or an explicit "no results"
@@ -195,7 +197,8 @@ async def lookup(query: str) -> str:
                 continue
 
             for m in reversed(got):
-                if m.id > sent.id and all(m.id != x.id for x in msgs):
+                if m.id > sent.id and m.id not in seen_ids:
+                    seen_ids.add(m.id)
                     msgs.append(m)
 
             # Fast-path "no results" — every reply is short text and at
@@ -338,12 +341,15 @@ async def run(session, target):
     # dict ops on potentially huge reports) are CPU-bound and sync — run
     # them in a worker thread so the live dashboard animator and any
     # other concurrent module's I/O isn't frozen during parsing.
-    parsed_data = await asyncio.to_thread(parse_html_report, html_content)
-    summary = await asyncio.to_thread(_summarize, parsed_data, PARENT)
+    summary = await asyncio.to_thread(_parse_and_summarize, html_content, PARENT)
 
     return 0, summary
 
 
+def _parse_and_summarize(html_content: str, parent: str) -> list:
+    return _summarize(parse_html_report(html_content), parent)
+
+
 # Order matters — first match wins. Plaintext password vs hashed-password
 # is the most actionable distinction so it lives at the top.
 _CATEGORY_RULES = [
@@ -397,6 +403,7 @@ _CATEGORY_ORDER = [
 _CATEGORY_LIMIT = None
 
 
+@lru_cache(maxsize=512)
 def _classify(label: str) -> str:
     s = label.lower()
     for cat, match in _CATEGORY_RULES:
@@ -405,11 +412,12 @@ def _classify(label: str) -> str:
     return "📋 Other"
 
 
+# Category -> position in _CATEGORY_ORDER.
+_CATEGORY_PRIORITY = {cat: i for i, cat in enumerate(_CATEGORY_ORDER)}
+
+
 def _category_priority(cat: str) -> int:
-    try:
-        return _CATEGORY_ORDER.index(cat)
-    except ValueError:
-        return len(_CATEGORY_ORDER)
+    return _CATEGORY_PRIORITY.get(cat, len(_CATEGORY_ORDER))
 
 
 def _format_breaches(breaches: dict) -> str:
@@ -422,14 +430,21 @@ def _format_breaches(breaches: dict) -> str:
     return ", ".join(parts) or "Unknown"
 
 
+_CATEGORY_RISK = {
+    "🔑 Passwords": "critical",
+    "🔐 Hashes": "critical",
+    "📱 Phones": "high",
+    "🌐 IPs": "high",
+    "📍 Locations": "high",
+    "💸 Financial": "high",
+    "👤 Names": "medium",
+    "📧 Emails": "medium",
+    "🆔 Identifiers": "medium",
+}
+
+
 def _risk_for(category: str) -> str:
-    if category in {"🔑 Passwords", "🔐 Hashes"}:
-        return "critical"
-    if category in {"📱 Phones", "🌐 IPs", "📍 Locations", "💸 Financial"}:
-        return "high"
-    if category in {"👤 Names", "📧 Emails", "🆔 Identifiers"}:
-        return "medium"
-    return "low"
+    return _CATEGORY_RISK.get(category, "low")
 
 
 def _summarize(parsed_data: dict, parent: str) -> list:
@@ -450,15 +465,16 @@ def _summarize(parsed_data: dict, parent: str) -> list:
                 if not value or value.lower() in {"none", "n/a", "null"}:
                     continue
                 category = _classify(k)
-                slot = by_value.setdefault(
-                    value,
-                    {"category": category, "breaches": {}},
-                )
+                slot = by_value.get(value)
+                if slot is None:
+                    by_value[value] = {"category": category, "breaches": {breach: 1}}
+                    continue
                 # If the same literal value shows up under different field
                 # labels across breaches, keep the most specific category.
                 if _category_priority(category) < _category_priority(slot["category"]):
                     slot["category"] = category
-                slot["breaches"][breach] = slot["breaches"].get(breach, 0) + 1
+                breaches = slot["breaches"]
+                breaches[breach] = breaches.get(breach, 0) + 1
 
     results = []
 
@@ -11,9 +11,9 @@ INFO = {
 async def run(session, target):
     try:
         obj = ipaddress.ip_address(target)
-        return 0, [
-            {"label": "Version", "value": f"IPv{obj.version}", "source": "StdLib", "risk": "low"},
-            {"label": "Private", "value": str(obj.is_private), "source": "StdLib", "risk": "medium" if not obj.is_private else "low"}
-        ]
-    except:
+    except ValueError:
         return 1, []
+    return 0, [
+        {"label": "Version", "value": f"IPv{obj.version}", "source": "StdLib", "risk": "low"},
+        {"label": "Private", "value": str(obj.is_private), "source": "StdLib", "risk": "medium" if not obj.is_private else "low"}
+    ]
@@ -19,7 +19,7 @@ async def run(session, target):
         async def search(query):
             try:
                 return await geolocator.geocode(query, language="en", addressdetails=True)
-            except:
+            except Exception:
                 return None
 
         location = await search(target)
@@ -2,6 +2,22 @@ import re
 import ipaddress
 import phonenumbers
 
+_EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+
+# Explicit "type:value" prefixes -> target type (module folder name).
+_PREFIX_TYPES = {
+    "addr": "address", "address": "address", "loc": "address",
+    "user": "username", "username": "username", "u": "username",
+    "phone": "phone", "tel": "phone",
+    "ip": "ip", "host": "ip",
+    "email": "email", "mail": "email",
+    "name": "name", "n": "name",
+    "id": "id", "ic": "id",
+    "ssn": "ssn",
+    "passport": "passport", "pp": "passport",
+    "hash": "hash", "h": "hash",
+}
+
 def detect_target_type(target):
     target = target.strip()
     
@@ -12,26 +28,9 @@ def detect_target_type(target):
         prefix = prefix.lower()
         
         # Map short prefixes to folder names
-        if prefix in ["addr", "address", "loc"]:
-            return "address", value.strip()
-        if prefix in ["user", "username", "u"]:
-            return "username", value.strip()
-        if prefix in ["phone", "tel"]:
-            return "phone", value.strip()
-        if prefix in ["ip", "host"]:
-            return "ip", value.strip()
-        if prefix in ["email", "mail"]:
-            return "email", value.strip()
-        if prefix in ["name", "n"]:
-            return "name", value.strip()
-        if prefix in ["id", "ic"]:
-            return "id", value.strip()
-        if prefix in ["ssn"]:
-            return "ssn", value.strip()
-        if prefix in ["passport", "pp"]:
-            return "passport", value.strip()
-        if prefix in ["hash", "h"]:
-            return "hash", value.strip()
+        target_type = _PREFIX_TYPES.get(prefix)
+        if target_type:
+            return target_type, value.strip()
 
     # --- 2. STRICT AUTO-DETECTION ---
     
@@ -43,7 +42,7 @@ def detect_target_type(target):
         pass
 
     # Email (Strict Regex)
-    if re.match(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$", target):
+    if _EMAIL_PATTERN.fullmatch(target):
         return "email", target
 
     # Phone — accept anything libphonenumbers can structurally parse with
@@ -10,7 +10,9 @@ Four flavors:
 import html as _html
 import json
 import re
+import sys
 import time
+from functools import lru_cache
 
 
 def print_results(report, target=None, fmt="raw"):
@@ -37,6 +39,7 @@ def _name_tokens(s):
     return re.findall(r"[a-zà-ÿ]{2,}", s.lower())
 
 
+@lru_cache(maxsize=1024)
 def _name_matches_target(name, target_local):
     """Does this name plausibly belong to the target?"""
     if not name or not target_local:
@@ -60,12 +63,15 @@ _CARRIER_NAMES = {
 }
 
 
+_NON_DIGIT_PATTERN = re.compile(r"\D")
+
+
 def _looks_like_phone_number(s):
     """Strict phone-shape check — keeps real numbers, drops carrier names."""
-    digits = re.sub(r"\D", "", s)
+    digits = _NON_DIGIT_PATTERN.sub("", s)
     if 7 <= len(digits) <= 15:
         # Reject strings dominated by alpha (e.g. "Reliance Jio" with stray digits).
-        alpha = sum(c.isalpha() for c in s)
+        alpha = sum(map(str.isalpha, s))
         return alpha < len(digits)
     return False
 
@@ -81,23 +87,30 @@ _LOCATION_NOISE = {
 }
 
 
+_NUMERIC_NOISE_PATTERN = re.compile(r"[\-\d.,\s]+")
+_STATE_CODE_PATTERN = re.compile(r"[A-Z]{2}")
+
+
 def _is_meaningful_location(s):
     s = s.strip()
     if not s:
         return False
     # Pure numeric / lat-lng noise.
-    if re.match(r"^[\-\d.,\s]+$", s):
+    if _NUMERIC_NOISE_PATTERN.fullmatch(s):
         return False
     # Single 2-letter token (US state codes alone are noise without context).
-    if re.match(r"^[A-Z]{2}$", s):
+    if _STATE_CODE_PATTERN.fullmatch(s):
         return False
     if s.lower() in _LOCATION_NOISE:
         return False
     return True
 
 
+_IPV4_PATTERN = re.compile(r"\d{1,3}(\.\d{1,3}){3}")
+
+
 def _is_ip(s):
-    return bool(re.match(r"^\d{1,3}(\.\d{1,3}){3}$", s.strip()))
+    return bool(_IPV4_PATTERN.fullmatch(s.strip()))
 
 
 # ---------- raw ----------
@@ -130,13 +143,14 @@ def _print_raw(report):
 
     for source in sorted(groups):
         items = groups[source]
-        print(f"{source} ({len(items)})")
-        max_label = max(len(_label(i)) for i in items)
-        for item in items:
-            label = _label(item).ljust(max_label)
+        block = [f"{source} ({len(items)})"]
+        labels = [_label(i) for i in items]
+        max_label = max(map(len, labels))
+        for label, item in zip(labels, items):
             value = str(item.get("value", "N/A"))
-            print(f"  {label} : {value}")
-        print()
+            block.append(f"  {label.ljust(max_label)} : {value}")
+        block.append("\n")
+        sys.stdout.write("\n".join(block))
 
 
 def _label(item):
@@ -216,6 +230,21 @@ footer { margin-top: 2.5rem; color: #8b949e; font-size: .75rem; text-align: cent
 }
 """
 
+_HTML_HEAD_OPEN = "\n".join((
+    "<!DOCTYPE html>",
+    '<html lang="en"><head>',
+    '<meta charset="utf-8">',
+    '<meta name="viewport" content="width=device-width, initial-scale=1">',
+))
+_HTML_HEAD_CLOSE = "\n".join((
+    f"<style>{_HTML_CSS}</style>",
+    "</head><body>",
+    '<header class="report-head">',
+    "<h1>xsint identity report</h1>",
+    '<div class="meta">',
+))
+_HTML_TAIL = "<footer>generated by xsint</footer>\n</body></html>"
+
 
 def _print_html(report, target):
     """Render the identity dossier as a styled HTML page.
@@ -232,18 +261,13 @@ def _print_html(report, target):
     error = report.get("error")
     sources = sorted({r.get("source") for r in results if r.get("source")})
 
+    target_html = _html.escape(target_str)
+
     parts = [
-        "<!DOCTYPE html>",
-        '<html lang="en"><head>',
-        '<meta charset="utf-8">',
-        '<meta name="viewport" content="width=device-width, initial-scale=1">',
-        f"<title>xsint identity report — {_html.escape(target_str)}</title>",
-        f"<style>{_HTML_CSS}</style>",
-        "</head><body>",
-        '<header class="report-head">',
-        "<h1>xsint identity report</h1>",
-        '<div class="meta">',
-        f"target  : <strong>{_html.escape(target_str)}</strong><br>",
+        _HTML_HEAD_OPEN,
+        f"<title>xsint identity report — {target_html}</title>",
+        _HTML_HEAD_CLOSE,
+        f"target  : <strong>{target_html}</strong><br>",
         f"type    : {_html.escape(target_type)}<br>",
         f"scanned : {_html.escape(when)}<br>",
         f"findings: {len(results)} across {len(sources)} source"
@@ -414,8 +438,7 @@ def _print_html(report, target):
                  ]))
             ]))
 
-    parts.append("<footer>generated by xsint</footer>")
-    parts.append("</body></html>")
+    parts.append(_HTML_TAIL)
     print("\n".join(parts))
 
 
@@ -471,60 +494,71 @@ def _linkify_html(text):
 
 # ---------- pretty (identity dossier) ----------
 
+_PRETTY_WIDTH = 78
+# Full-width fill runs; every rule, pad and gap is a slice of these.
+_RULE = "─" * _PRETTY_WIDTH
+_BLANK = " " * _PRETTY_WIDTH
+# (BOLD, DIM, YEL, GRN, RED, RST), keyed by whether stdout is a TTY.
+_PRETTY_PALETTE = {
+    True: ("\033[1m", "\033[2m", "\033[33m", "\033[32m", "\033[31m", "\033[0m"),
+    False: ("", "", "", "", "", ""),
+}
+
+
 def _print_pretty(report, target):
+    out = []
+    _render_pretty(report, target, out.append)
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _render_pretty(report, target, emit):
     target_type = str(report.get("type", "unknown")).lower()
     error = report.get("error")
-    width = 78
+    width = _PRETTY_WIDTH
 
     # Color codes — only when stdout is a real TTY; piped/file output
     # stays clean.
-    is_tty = __import__("sys").stdout.isatty()
-    BOLD = "\033[1m" if is_tty else ""
-    DIM = "\033[2m" if is_tty else ""
-    YEL = "\033[33m" if is_tty else ""
-    GRN = "\033[32m" if is_tty else ""
-    RED = "\033[31m" if is_tty else ""
-    RST = "\033[0m" if is_tty else ""
+    BOLD, DIM, YEL, GRN, RED, RST = _PRETTY_PALETTE[sys.stdout.isatty()]
 
     # Header banner
-    print()
-    print(f"  {BOLD}IDENTITY REPORT{RST}")
-    print(f"  {target or '(unknown)'}")
-    print(f"  {DIM}{'─' * (width - 4)}{RST}")
+    emit("")
+    emit(f"  {BOLD}IDENTITY REPORT{RST}")
+    emit(f"  {target or '(unknown)'}")
+    emit(f"  {DIM}{_RULE[:width - 4]}{RST}")
 
     if error:
-        print(f"  status    {RED}aborted{RST}")
-        print(f"  error     {error}")
-        print()
+        emit(f"  status    {RED}aborted{RST}")
+        emit(f"  error     {error}")
+        emit("")
         return
 
     results = report.get("results", []) or []
     sources = sorted({r.get("source") for r in results if r.get("source")})
 
     if not results:
-        print(f"  status    {DIM}no intel found{RST}")
-        print()
+        emit(f"  status    {DIM}no intel found{RST}")
+        emit("")
         return
 
     bins = _bin_findings(results, target=target)
 
-    print(f"  type      {target_type}")
-    print(f"  scanned   {time.strftime('%Y-%m-%d %H:%M', time.localtime())}")
+    emit(f"  type      {target_type}")
+    emit(f"  scanned   {time.strftime('%Y-%m-%d %H:%M', time.localtime())}")
     scope = (
         f"{len(sources)} sources · {len(bins['breaches'])} breaches · "
         f"{len(bins['passwords'])} passwords · {len(bins['hashes'])} hashes"
     )
-    print(f"  scope     {DIM}{scope}{RST}")
-    print()
+    emit(f"  scope     {DIM}{scope}{RST}")
+    emit("")
 
     # ── Local helpers wired to the live color flags ──
     def _section(title, count=None):
         heading = title.upper()
         if count is not None:
             heading += f"  ·  {count}"
-        print()
-        print(f"  {BOLD}{heading}{RST}")
-        print(f"  {DIM}{'─' * len(heading)}{RST}")
+        emit("")
+        emit(f"  {BOLD}{heading}{RST}")
+        emit(f"  {DIM}{_RULE[:len(heading)]}{RST}")
 
     def _visible(s):
         """Length of `s` ignoring ANSI escape codes."""
@@ -533,6 +567,9 @@ def _print_pretty(report, target):
     LABEL_COL = 14  # max label width
     LABEL_GAP = 2   # min spaces between label and value
 
+    # label -> (padded label, prefix width, continuation pad)
+    label_cells = {}
+
     def _row(label, value, attr=None, value_color=""):
         """Emit one row: label (left), value, dim attribution (right).
 
@@ -540,24 +577,30 @@ def _print_pretty(report, target):
         """
         indent = "  "
         label = label or ""
-        pad = max(LABEL_GAP, LABEL_COL - _visible(label) + LABEL_GAP)
-        label_str = label + " " * pad
-        prefix_w = len(indent) + _visible(label) + pad
+        cell = label_cells.get(label)
+        if cell is None:
+            vis = _visible(label)
+            pad = max(LABEL_GAP, LABEL_COL - vis + LABEL_GAP)
+            # Can be wider than _BLANK for a long label, so not sliced.
+            cell = label_cells[label] = (
+                label + _BLANK[:pad], len(indent) + vis + pad, " " * (vis + pad),
+            )
+        label_str, prefix_w, cont_pad = cell
 
         v = str(value)
         full_value = f"{value_color}{v}{RST}" if value_color else v
 
         if not attr:
-            print(f"{indent}{label_str}{full_value}")
+            emit(f"{indent}{label_str}{full_value}")
             return
 
         line_w = prefix_w + len(v) + 2 + len(attr)
         if line_w <= width:
             gap = width - prefix_w - len(v) - len(attr)
-            print(f"{indent}{label_str}{full_value}{' ' * gap}{DIM}{attr}{RST}")
+            emit(f"{indent}{label_str}{full_value}{_BLANK[:gap]}{DIM}{attr}{RST}")
         else:
-            print(f"{indent}{label_str}{full_value}")
-            print(f"{indent}{' ' * (prefix_w - len(indent))}{DIM}└─ {attr}{RST}")
+            emit(f"{indent}{label_str}{full_value}")
+            emit(f"{indent}{cont_pad}{DIM}└─ {attr}{RST}")
 
     def _multirow(label, items):
         """First item gets the label, rest get blank label."""
@@ -598,7 +641,7 @@ def _print_pretty(report, target):
         services = sorted({s for s, _ in bins["registered_on"]}, key=str.lower)
         _section("Registered accounts", count=len(services))
         for line in _wrap(" · ".join(services), width - 4):
-            print(f"  {line}")
+            emit(f"  {line}")
 
     # ── Contact ──────────────────────────────────
     contact_blocks = [
@@ -636,7 +679,7 @@ def _print_pretty(report, target):
         for date, name, src in dated:
             _row("", f"{date}  {name}", src)
         if dated and undated:
-            print()
+            emit("")
         for name, src in undated:
             _row("", name, src)
 
@@ -649,7 +692,7 @@ def _print_pretty(report, target):
             ])
         if bins["hashes"]:
             if bins["passwords"]:
-                print()
+                emit("")
             _multirow(f"hashes {DIM}({len(bins['hashes'])}){RST}", [
                 (v, ", ".join(b) if b else None) for v, b in bins["hashes"]
             ])
@@ -657,16 +700,21 @@ def _print_pretty(report, target):
     # ── Activity ─────────────────────────────────
     activity_lines = [evt for evt, _src in bins["activity"]]
     if bins["dates"]:
+        # Only the first few dates per breach are shown.
+        per_breach = 5
         by_breach = {}
         for date_label, date_val, breach in bins["dates"]:
+            entries = by_breach.setdefault(breach, [])
+            if len(entries) >= per_breach:
+                continue
             norm = re.sub(r"\s*×\d+\s*$", "", date_label)
             norm = re.sub(r"\s*\+\d+\s*more\s*$", "", norm)
             if norm.lower().strip() == breach.lower().strip():
-                by_breach.setdefault(breach, []).append(date_val)
+                entries.append(date_val)
             else:
-                by_breach.setdefault(breach, []).append(f"{norm}: {date_val}")
+                entries.append(f"{norm}: {date_val}")
         for breach in sorted(by_breach):
-            for entry in by_breach[breach][:5]:
+            for entry in by_breach[breach]:
                 activity_lines.append((entry, breach))
     if activity_lines:
         _section("Activity")
@@ -682,7 +730,7 @@ def _print_pretty(report, target):
         for label, url in bins["links"]:
             _row("", url, label)
 
-    print()
+    emit("")
 
 
 def _section_pretty(title, rows):
@@ -729,19 +777,27 @@ def _format_creds(items):
 
 
 def _wrap(text, width):
-    out, line = [], ""
+    out, line, line_len = [], [], 0
     for chunk in text.split(", "):
-        candidate = chunk if not line else f"{line}, {chunk}"
-        if len(candidate) > width and line:
-            out.append(line + ",")
-            line = chunk
+        if not line_len:
+            line, line_len = [chunk], len(chunk)
+            continue
+        candidate_len = line_len + 2 + len(chunk)
+        if candidate_len > width:
+            out.append(", ".join(line) + ",")
+            line, line_len = [chunk], len(chunk)
         else:
-            line = candidate
-    if line:
-        out.append(line)
+            line.append(chunk)
+            line_len = candidate_len
+    if line_len:
+        out.append(", ".join(line))
     return out
 
 
+_BREACH_DATE_PATTERN = re.compile(r"(.*?)\s*\(([^)]+)\)\s*")
+_INTELX_RESULT_PATTERN = re.compile(r"(.*?)\s*\(([^,]+),\s*([^)]+)\)\s*")
+
+
 # Bin findings into identity sections. The classifier is permissive on
 # purpose — modules emit slightly different shapes, and we'd rather fall
 # back to "other" than mis-categorize.
@@ -797,7 +853,9 @@ def _bin_findings(results, target=None):
         key = value.lower().strip()
         if not key:
             return
-        slot = merger.setdefault(key, {"value": value, "breaches": []})
+        slot = merger.get(key)
+        if slot is None:
+            slot = merger[key] = {"value": value, "breaches": []}
         if breach and breach not in slot["breaches"]:
             slot["breaches"].append(breach)
 
@@ -805,6 +863,12 @@ def _bin_findings(results, target=None):
         """Expand 'Foo ×3, Bar, +2 more' into ['Foo', 'Bar']."""
         if not breach_attr:
             return []
+        if "," not in breach_attr and "×" not in breach_attr and "+" not in breach_attr:
+            # A single plain name: the split and cleanup can't change it.
+            chunk = breach_attr.strip()
+            if chunk and chunk.lower() not in ("unknown", "summary"):
+                return [chunk]
+            return []
         out = []
         for chunk in breach_attr.split(","):
             chunk = chunk.strip()
@@ -829,11 +893,9 @@ def _bin_findings(results, target=None):
         if not name or name.lower() in {"unknown", "summary", ""}:
             return
         key = _normalize_breach_key(name)
-        slot = breach_merge.setdefault(key, {
-            "name": name,
-            "date": "",
-            "sources": [],
-        })
+        slot = breach_merge.get(key)
+        if slot is None:
+            slot = breach_merge[key] = {"name": name, "date": "", "sources": []}
         # Prefer the longer/more specific casing if multiple sources
         # disagree (e.g. "exploit.in" vs "Exploit.In").
         if name and (len(name) > len(slot["name"]) or
@@ -906,7 +968,7 @@ def _bin_findings(results, target=None):
         # Sources that report breach lists feed into the merger so the
         # final dossier shows one row per breach with merged attribution.
         if source in ("9Ghz", "HIBP") and label == "Breach":
-            m = re.match(r"^(.*?)\s*\(([^)]+)\)\s*$", value)
+            m = _BREACH_DATE_PATTERN.fullmatch(value)
             if m:
                 merge_breach(m.group(1).strip(), m.group(2).strip(), source)
             else:
@@ -917,7 +979,7 @@ def _bin_findings(results, target=None):
         # breach/leak label, bucket is the data store. Treat the name
         # like any other breach hit so cross-source dedup works.
         if source == "IntelX" and label.startswith("Result"):
-            m = re.match(r"^(.*?)\s*\(([^,]+),\s*([^)]+)\)\s*$", value)
+            m = _INTELX_RESULT_PATTERN.fullmatch(value)
             if m:
                 merge_breach(m.group(1).strip(), m.group(3).strip(), "IntelX")
             else:
@@ -1077,12 +1139,16 @@ def _bin_findings(results, target=None):
     return bins
 
 
+@lru_cache(maxsize=1024)
 def _normalize_breach_key(name: str) -> str:
     """Best-effort normalization for cross-source breach matching.
 
     Strips trailing version markers, "database"/"dump" suffixes, year
     suffixes, and casing so 9Ghz's "Exploit.In Database (2017)" merges
     with HIBP's "exploit.in" and Haxalot's "Exploit.In".
+
+    Memoized: a Haxalot report names the same handful of breaches on
+    every row, and each call is four regex passes.
     """
     s = name.strip().lower()
     # Drop trailing parenthetical (years, sizes, "Breach", etc.)
@@ -1094,6 +1160,28 @@ def _normalize_breach_key(name: str) -> str:
     return s
 
 
+# Haxalot's aggregated-format group headers (lowercased) → dossier bin.
+_HAXALOT_GROUP_CATEGORIES = {
+    "🔑 passwords": "passwords",
+    "🔐 hashes": "hashes",
+    "👤 names": "names",
+    "👥 aliases": "aliases",
+    "📍 locations": "locations",
+    "📱 phones": "phones",
+    "📧 emails": "alt_emails",
+    "🌐 ips": "ips",
+    "💻 devices": "other",
+    "🔗 links": "links",
+    "💸 financial": "other",
+    "🏢 companies": "other",
+    "🆔 identifiers": "ids",
+    "📆 dates": "dates",
+    "📝 content": "other",
+    "📋 other": "other",
+    "📋 summary": "summary",
+}
+
+
 def _haxalot_classify(group, label):
     """Map a Haxalot row to (category, breach_attribution).
 
@@ -1101,28 +1189,9 @@ def _haxalot_classify(group, label):
     list in `label`) and the legacy per-breach format (breach in `group`,
     field name in `label`).
     """
-    new_format = {
-        "🔑 passwords": "passwords",
-        "🔐 hashes": "hashes",
-        "👤 names": "names",
-        "👥 aliases": "aliases",
-        "📍 locations": "locations",
-        "📱 phones": "phones",
-        "📧 emails": "alt_emails",
-        "🌐 ips": "ips",
-        "💻 devices": "other",
-        "🔗 links": "links",
-        "💸 financial": "other",
-        "🏢 companies": "other",
-        "🆔 identifiers": "ids",
-        "📆 dates": "dates",
-        "📝 content": "other",
-        "📋 other": "other",
-        "📋 summary": "summary",
-    }
     gl = group.lower().strip()
-    if gl in new_format:
-        return new_format[gl], (label or "Unknown").strip()
+    if gl in _HAXALOT_GROUP_CATEGORIES:
+        return _HAXALOT_GROUP_CATEGORIES[gl], (label or "Unknown").strip()
 
     breach = (group or "Unknown").strip()
     field = re.sub(r"^[^\w]+", "", label).strip().lower()